@@ -55,9 +55,8 @@ def get_config_filename(pgclirc_file=None):
 
 
 def get_config(pgclirc_file=None):
-    from pgcli import __file__ as package_root
-
-    package_root = os.path.dirname(package_root)
+    # this module lives at the root of the pgcli package
+    package_root = os.path.dirname(__file__)
 
     pgclirc_file = get_config_filename(pgclirc_file)
 
@@ -20,7 +20,7 @@ import pendulum
 import datetime as dt
 import itertools
 import platform
-from time import time, sleep
+from time import monotonic, sleep
 
 keyring = None  # keyring will be loaded later
 
@@ -786,13 +786,20 @@ class PGCli:
 
     def _build_cli(self, history):
         key_bindings = pgcli_bindings(self)
+        message_key = message = None
 
         def get_message():
+            nonlocal message_key, message
             if self.dsn_alias and self.prompt_dsn_format is not None:
                 prompt_format = self.prompt_dsn_format
             else:
                 prompt_format = self.prompt_format
 
+            # The prompt can only change when a command runs, after which
+            # self.now is refreshed. Reuse the parsed prompt between redraws.
+            if message_key == (prompt_format, self.now):
+                return message
+
             prompt = self.get_prompt(prompt_format)
 
             if (
@@ -802,12 +809,19 @@ class PGCli:
                 prompt = self.get_prompt("\\d> ")
 
             prompt = prompt.replace("\\x1b", "\x1b")
-            return ANSI(prompt)
+            message_key, message = (prompt_format, self.now), ANSI(prompt)
+            return message
 
-        def get_continuation(width, line_number, is_soft_wrap):
+        # The continuation only depends on the prompt width, so keep it around
+        # across redraws instead of rebuilding it for every line.
+        @functools.lru_cache(maxsize=16)
+        def get_continuation_for_width(width):
             continuation = self.multiline_continuation_char * (width - 1) + " "
             return [("class:continuation", continuation)]
 
+        def get_continuation(width, line_number, is_soft_wrap):
+            return get_continuation_for_width(width)
+
         get_toolbar_tokens = create_toolbar_tokens_func(self)
 
         if self.wider_completion_menu:
@@ -898,7 +912,7 @@ class PGCli:
         execution = 0
 
         # Run the query.
-        start = time()
+        start = monotonic()
         on_error_resume = self.on_error == "RESUME"
         res = self.pgexecute.run(
             text, self.pgspecial, exception_formatter, on_error_resume
@@ -934,11 +948,11 @@ class PGCli:
                 ),
                 style_output=self.style_output,
             )
-            execution = time() - start
+            execution = monotonic() - start
             formatted = format_output(title, cur, headers, status, settings)
 
             output.extend(formatted)
-            total = time() - start
+            total = monotonic() - start
 
             # Keep track of whether any of the queries are mutating or changing
             # the database
@@ -1065,20 +1079,28 @@ class PGCli:
         """Get the last query executed or None."""
         return self.query_history[-1][0] if self.query_history else None
 
-    def is_too_wide(self, line):
-        """Will this line be too wide to fit into terminal?"""
+    def is_too_wide(self, text):
+        """Will any line of this text be too wide to fit into terminal?"""
         if not self.prompt_app:
             return False
-        return (
-            len(COLOR_CODE_REGEX.sub("", line))
-            > self.prompt_app.output.get_size().columns
-        )
-
-    def is_too_tall(self, lines):
+        # Query the terminal size once, not once per line
+        width = self.prompt_app.output.get_size().columns
+        # No line can be wider than the whole text
+        if len(text) <= width:
+            return False
+        # Strip color codes from the whole text in one pass and measure the
+        # lines with builtins, instead of a Python-level loop per line. Only
+        # run the regex if there are escape sequences to strip.
+        if "\x1b" in text:
+            text = COLOR_CODE_REGEX.sub("", text)
+        return max(map(len, text.split("\n"))) > width
+
+    def is_too_tall(self, text):
         """Are there too many lines to fit into terminal?"""
         if not self.prompt_app:
             return False
-        return len(lines) >= (self.prompt_app.output.get_size().rows - 4)
+        # Counting newlines avoids materializing the output as a list of lines
+        return text.count("\n") + 1 >= (self.prompt_app.output.get_size().rows - 4)
 
     def echo_via_pager(self, text, color=None):
         if self.pgspecial.pager_config == PAGER_OFF or self.watch_command:
@@ -1087,10 +1109,8 @@ class PGCli:
             self.pgspecial.pager_config == PAGER_LONG_OUTPUT
             and self.table_format != "csv"
         ):
-            lines = text.split("\n")
-
             # The last 4 lines are reserved for the pgcli menu and padding
-            if self.is_too_tall(lines) or any(self.is_too_wide(l) for l in lines):
+            if self.is_too_tall(text) or self.is_too_wide(text):
                 click.echo_via_pager(text, color=color)
             else:
                 click.echo(text, color=color)
@@ -1429,9 +1449,11 @@ def format_output(title, cur, headers, status, settings):
     def format_arrays(data, headers, **_):
         data = list(data)
         for row in data:
-            row[:] = [
-                format_array(val) if isinstance(val, list) else val for val in row
-            ]
+            # Only touch array cells; rebuilding every row is wasted work for
+            # the common case of results without arrays.
+            for i, val in enumerate(row):
+                if isinstance(val, list):
+                    row[i] = format_array(val)
 
         return data, headers
 
@@ -1465,23 +1487,6 @@ def format_output(title, cur, headers, status, settings):
         headers = [case_function(x) for x in headers]
         if max_width is not None:
             cur = list(cur)
-        column_types = None
-        if hasattr(cur, "description"):
-            column_types = []
-            for d in cur.description:
-                if (
-                    d[1] in psycopg2.extensions.DECIMAL.values
-                    or d[1] in psycopg2.extensions.FLOAT.values
-                ):
-                    column_types.append(float)
-                if (
-                    d[1] == psycopg2.extensions.INTEGER.values
-                    or d[1] in psycopg2.extensions.LONGINTEGER.values
-                ):
-                    column_types.append(int)
-                else:
-                    column_types.append(str)
-
         formatted = formatter.format_output(cur, headers, **output_kwargs)
         if isinstance(formatted, str):
             formatted = iter(formatted.splitlines())
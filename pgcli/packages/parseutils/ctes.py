@@ -2,6 +2,7 @@ from sqlparse import parse
 from sqlparse.tokens import Keyword, CTE, DML
 from sqlparse.sql import Identifier, IdentifierList, Parenthesis
 from collections import namedtuple
+from itertools import accumulate
 from .meta import TableMetadata, ColumnMetadata
 
 
@@ -34,7 +35,7 @@ def isolate_query_ctes(full_text, text_before_cursor):
             return full_text, text_before_cursor, meta
 
         # Append this cte to the list of available table metadata
-        cols = (ColumnMetadata(name, None, ()) for name in cte.columns)
+        cols = tuple(ColumnMetadata(name, None, ()) for name in cte.columns)
         meta.append(TableMetadata(cte.name, cols))
 
     # Editing past the last cte (ie the main body of the query)
@@ -70,9 +71,12 @@ def extract_ctes(sql):
     ctes = []
 
     if isinstance(tok, IdentifierList):
-        # Multiple ctes
+        # Multiple ctes. Build the start offset of every token in the list
+        # once, instead of re-summing all preceding tokens for each cte.
+        offsets = [0]
+        offsets.extend(accumulate(len(str(t)) for t in tok.tokens))
         for t in tok.get_identifiers():
-            cte_start_offset = token_start_pos(tok.tokens, tok.token_index(t))
+            cte_start_offset = offsets[tok.token_index(t)]
             cte = get_cte_from_token(t, start_pos + cte_start_offset)
             if not cte:
                 continue
@@ -94,6 +94,10 @@ class FunctionMetadata:
         self.is_extension = bool(is_extension)
         self.is_public = self.schema_name and self.schema_name == "public"
 
+        # Instances are used as dict keys on the completion path (see
+        # PGCompleter._arg_list_cache), so hash the signature only once
+        self._hash = hash(self._signature())
+
     def __eq__(self, other):
         return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
@@ -116,7 +120,7 @@ class FunctionMetadata:
         )
 
     def __hash__(self):
-        return hash(self._signature())
+        return self._hash
 
     def __repr__(self):
         return (
@@ -78,18 +78,18 @@ def find_prev_keyword(sql, n_skip=0):
 
     logical_operators = ("AND", "OR", "NOT", "BETWEEN")
 
-    for t in reversed(flattened):
+    for idx in range(len(flattened) - 1, -1, -1):
+        t = flattened[idx]
         if t.value == "(" or (
             t.is_keyword and (t.value.upper() not in logical_operators)
         ):
-            # Find the location of token t in the original parsed statement
-            # We can't use parsed.token_index(t) because t may be a child token
+            # idx is the location of token t in the flattened statement. We
+            # can't use parsed.token_index(t) because t may be a child token
             # inside a TokenList, in which case token_index throws an error
             # Minimal example:
             #   p = sqlparse.parse('select * from foo where bar')
             #   t = list(p.flatten())[-3]  # The "Where" token
             #   p.token_index(t)  # Throws ValueError: not in list
-            idx = flattened.index(t)
 
             # Combine the string values of all tokens in the original list
             # up to and including the target keyword token t, to produce a
@@ -2,6 +2,7 @@ import sys
 import re
 import sqlparse
 from collections import namedtuple
+from functools import lru_cache
 from sqlparse.sql import Comparison, Identifier, Where
 from .parseutils.utils import last_word, find_prev_keyword, parse_partial_identifier
 from .parseutils.tables import extract_tables
@@ -125,12 +126,18 @@ class SqlStatement:
         return prev_keyword
 
 
+@lru_cache(maxsize=32)
 def suggest_type(full_text, text_before_cursor):
     """Takes the full_text that is typed so far and also the text before the
     cursor to suggest completion type and scope.
 
     Returns a tuple with a type of entity ('table', 'column' etc) and a scope.
     A scope for a column category will be a list of tables.
+
+    Results are memoized, since completions are often requested several
+    times for the same document (e.g. while typing and then on <Tab>), and
+    parsing the statement is the expensive part. Callers must not mutate
+    the returned suggestions.
     """
 
     if full_text.startswith("\\i "):
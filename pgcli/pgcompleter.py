@@ -1,5 +1,6 @@
 import logging
 import re
+from functools import lru_cache
 from itertools import count, repeat, chain
 import operator
 from collections import namedtuple, defaultdict, OrderedDict
@@ -58,14 +59,51 @@ def Candidate(
 # Used to strip trailing '::some_type' from default-value expressions
 arg_default_type_strip_regex = re.compile(r"::[\w\.]+(\[\])?$")
 
+# Map a completion's meta to its priority, for breaking ties between
+# candidates of different types
+_type_priority = {
+    meta: priority
+    for priority, meta in enumerate(
+        [
+            "keyword",
+            "function",
+            "view",
+            "table",
+            "datatype",
+            "database",
+            "schema",
+            "column",
+            "table alias",
+            "join",
+            "name join",
+            "fk join",
+            "table format",
+        ]
+    )
+}
+
+# Neither of these hold per-call state, so share one instance instead of
+# building them for every completion request
+_table_formatter = TabularOutputFormatter()
+_path_completer = PathCompleter(expanduser=True)
+
+# Sort keys shared by all calls to find_matches, so they aren't rebuilt for
+# every matching item
+_exact_match_sort_key = (float("Infinity"), -1)
+_negative_infinity = -float("Infinity")
+
 normalize_ref = lambda ref: ref if ref[0] == '"' else '"' + ref.lower() + '"'
 
 
+@lru_cache(maxsize=4096)
 def generate_alias(tbl):
     """Generate a table alias, consisting of all upper-case letters in
     the table name, or, if there are no upper-case letters, the first letter +
     all letters preceded by _
     param tbl - unescaped name of the table to alias
+
+    Aliases are generated as synonyms for every table and column candidate
+    on each keystroke, so results are memoized.
     """
     return "".join(
         [l for l in tbl if l.isupper()]
@@ -73,11 +111,52 @@ def generate_alias(tbl):
     )
 
 
+@lru_cache(maxsize=4096)
+def _lexical_priority(item):
+    """Lexical order of an item in a completion collection, used for
+    tiebreaking items with the same match group length and start position.
+
+    Since we use *higher* priority to mean "more important," we use -ord(c)
+    to prioritize "aa" > "ab" and end with 1 to prioritize shorter strings
+    (ie "user" > "users"). We first do a case-insensitive sort and then a
+    case-sensitive one as a tie breaker.
+    We also unquote the name to make sure quoted names have the same priority
+    as unquoted names.
+
+    The same completion collections are matched on every keystroke, so the
+    result is memoized per item.
+    """
+    name = item.lower()
+    if name and name[0] == '"' and name[-1] == '"':
+        name = name[1:-1]
+    return tuple(0 if c in " _" else -ord(c) for c in name) + (1,) + tuple(item)
+
+
+def _case_keywords_tree(keywords_tree):
+    """Returns {casing: {keyword: [next keywords]}} for the 'upper' and 'lower'
+    casings, skipping keywords without well known following keywords. The
+    None key holds the list of all top-level keywords.
+    """
+    cased_trees = {}
+    for casing, case in (("upper", str.upper), ("lower", str.lower)):
+        tree = {None: [case(k) for k in keywords_tree]}
+        tree.update(
+            (k, [case(next_kw) for next_kw in next_kws])
+            for k, next_kws in keywords_tree.items()
+            if next_kws
+        )
+        cased_trees[casing] = tree
+    return cased_trees
+
+
 class PGCompleter(Completer):
     # keywords_tree: A dict mapping keywords to well known following keywords.
     # e.g. 'CREATE': ['TABLE', 'USER', ...],
     keywords_tree = get_literals("keywords", type_=dict)
     keywords = tuple(set(chain(keywords_tree.keys(), *keywords_tree.values())))
+    # keywords_tree never changes, so build its upper- and lower-cased
+    # versions once instead of on every keyword completion
+    cased_keywords_tree = _case_keywords_tree(keywords_tree)
     functions = get_literals("functions")
     datatypes = get_literals("datatypes")
     reserved_words = set(get_literals("reserved"))
@@ -331,22 +410,7 @@ class PGCompleter(Completer):
         """
         if not collection:
             return []
-        prio_order = [
-            "keyword",
-            "function",
-            "view",
-            "table",
-            "datatype",
-            "database",
-            "schema",
-            "column",
-            "table alias",
-            "join",
-            "name join",
-            "fk join",
-            "table format",
-        ]
-        type_priority = prio_order.index(meta) if meta in prio_order else -1
+        type_priority = _type_priority.get(meta, -1)
         text = last_word(text, include="most_punctuations").lower()
         text_len = len(text)
 
@@ -372,14 +436,16 @@ class PGCompleter(Completer):
         if fuzzy:
             regex = ".*?".join(map(re.escape, text))
             pat = re.compile("(%s)" % regex)
+            first_word_len = len(text) + 1
+            first_words = (text, text + " ")
 
             def _match(item):
-                if item.lower()[: len(text) + 1] in (text, text + " "):
+                if item.lower()[:first_word_len] in first_words:
                     # Exact match of first word in suggestion
                     # This is to get exact alias matches to the top
                     # E.g. for input `e`, 'Entries E' should be on top
                     # (before e.g. `EndUsers EU`)
-                    return float("Infinity"), -1
+                    return _exact_match_sort_key
                 r = pat.search(self.unescape_name(item.lower()))
                 if r:
                     return -len(r.group()), -r.start()
@@ -392,7 +458,7 @@ class PGCompleter(Completer):
                 if match_point >= 0:
                     # Use negative infinity to force keywords to sort after all
                     # fuzzy matches
-                    return -float("Infinity"), -match_point
+                    return _negative_infinity, -match_point
 
         matches = []
         for cand in collection:
@@ -413,23 +479,7 @@ class PGCompleter(Completer):
                     # Truncate meta-text to 50 characters, if necessary
                     display_meta = display_meta[:47] + "..."
 
-                # Lexical order of items in the collection, used for
-                # tiebreaking items with the same match group length and start
-                # position. Since we use *higher* priority to mean "more
-                # important," we use -ord(c) to prioritize "aa" > "ab" and end
-                # with 1 to prioritize shorter strings (ie "user" > "users").
-                # We first do a case-insensitive sort and then a
-                # case-sensitive one as a tie breaker.
-                # We also use the unescape_name to make sure quoted names have
-                # the same priority as unquoted names.
-                lexical_priority = (
-                    tuple(
-                        0 if c in " _" else -ord(c)
-                        for c in self.unescape_name(item.lower())
-                    )
-                    + (1,)
-                    + tuple(c for c in item)
-                )
+                lexical_priority = _lexical_priority(item)
 
                 item = self.case(item)
                 display = self.case(display)
@@ -844,7 +894,7 @@ class PGCompleter(Completer):
         return self.find_matches(word_before_cursor, tables, meta="table")
 
     def get_table_formats(self, _, word_before_cursor):
-        formats = TabularOutputFormatter().supported_formats
+        formats = _table_formatter.supported_formats
         return self.find_matches(word_before_cursor, formats, meta="table format")
 
     def get_view_matches(self, suggestion, word_before_cursor, alias=False):
@@ -863,13 +913,6 @@ class PGCompleter(Completer):
         return self.find_matches(word_before_cursor, self.databases, meta="database")
 
     def get_keyword_matches(self, suggestion, word_before_cursor):
-        keywords = self.keywords_tree.keys()
-        # Get well known following keywords for the last token. If any, narrow
-        # candidates to this list.
-        next_keywords = self.keywords_tree.get(suggestion.last_token, [])
-        if next_keywords:
-            keywords = next_keywords
-
         casing = self.keyword_casing
         if casing == "auto":
             if word_before_cursor and word_before_cursor[-1].islower():
@@ -877,21 +920,20 @@ class PGCompleter(Completer):
             else:
                 casing = "upper"
 
-        if casing == "upper":
-            keywords = [k.upper() for k in keywords]
-        else:
-            keywords = [k.lower() for k in keywords]
+        cased_keywords = self.cased_keywords_tree[casing]
+        # Get well known following keywords for the last token. If any, narrow
+        # candidates to this list.
+        keywords = cased_keywords.get(suggestion.last_token) or cased_keywords[None]
 
         return self.find_matches(
             word_before_cursor, keywords, mode="strict", meta="keyword"
         )
 
     def get_path_matches(self, _, word_before_cursor):
-        completer = PathCompleter(expanduser=True)
         document = Document(
             text=word_before_cursor, cursor_position=len(word_before_cursor)
         )
-        for c in completer.get_completions(document, None):
+        for c in _path_completer.get_completions(document, None):
             yield Match(completion=c, priority=(0,))
 
     def get_special_matches(self, _, word_before_cursor):
@@ -1011,13 +1053,15 @@ class PGCompleter(Completer):
 
         """
 
-        return [
-            SchemaObject(
-                name=obj, schema=(self._maybe_schema(schema=sch, parent=schema))
+        objects = []
+        for sch in self._get_schemas(obj_type, schema):
+            # Resolved once per schema rather than once per object
+            maybe_schema = self._maybe_schema(schema=sch, parent=schema)
+            objects.extend(
+                SchemaObject(name=obj, schema=maybe_schema)
+                for obj in self.dbmetadata[obj_type][sch].keys()
             )
-            for sch in self._get_schemas(obj_type, schema)
-            for obj in self.dbmetadata[obj_type][sch].keys()
-        ]
+        return objects
 
     def populate_functions(self, schema, filter_func):
         """Returns a list of function SchemaObjects.
@@ -1031,14 +1075,14 @@ class PGCompleter(Completer):
         # Because of multiple dispatch, we can have multiple functions
         # with the same name, which is why `for meta in metas` is necessary
         # in the comprehensions below
-        return [
-            SchemaObject(
-                name=func,
-                schema=(self._maybe_schema(schema=sch, parent=schema)),
-                meta=meta,
+        functions = []
+        for sch in self._get_schemas("functions", schema):
+            # Resolved once per schema rather than once per function
+            maybe_schema = self._maybe_schema(schema=sch, parent=schema)
+            functions.extend(
+                SchemaObject(name=func, schema=maybe_schema, meta=meta)
+                for (func, metas) in self.dbmetadata["functions"][sch].items()
+                for meta in metas
+                if filter_func(meta)
             )
-            for sch in self._get_schemas("functions", schema)
-            for (func, metas) in self.dbmetadata["functions"][sch].items()
-            for meta in metas
-            if filter_func(meta)
-        ]
+        return functions
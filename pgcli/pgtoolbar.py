@@ -52,12 +52,13 @@ def create_toolbar_tokens_func(pgcli):
         else:
             result.append(("class:bottom-toolbar", "[F4] Emacs-mode"))
 
+        # A transaction can't be both failed and valid, so only ask for the
+        # second state if the first didn't match.
         if pgcli.pgexecute.failed_transaction():
             result.append(
                 ("class:bottom-toolbar.transaction.failed", "     Failed transaction")
             )
-
-        if pgcli.pgexecute.valid_transaction():
+        elif pgcli.pgexecute.valid_transaction():
             result.append(
                 ("class:bottom-toolbar.transaction.valid", "     Transaction")
             )
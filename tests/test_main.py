@@ -162,10 +162,12 @@ test_data = [
     (10, 10, "-" * 11),
     (10, 10, "-" * 10),
     (10, 10, "-" * 9),
+    (10, 10, "\x1b[31m" + "-" * 11 + "\x1b[0m"),
+    (10, 10, "\x1b[31m" + "-" * 10 + "\x1b[0m"),
 ]
 
 # 4 lines are reserved at the bottom of the terminal for pgcli's prompt
-use_pager_when_on = [True, True, False, True, False, False]
+use_pager_when_on = [True, True, False, True, False, False, True, False]
 
 # Can be replaced with pytest.param once we can upgrade pytest after Python 3.4 goes EOL
 test_ids = [
@@ -175,6 +177,8 @@ test_ids = [
     "Output longer than terminal width",
     "Output equal to terminal width",
     "Output shorter than terminal width",
+    "Colored output longer than terminal width",
+    "Colored output equal to terminal width",
 ]
 
 